@@ -4,14 +4,11 @@ from __future__ import annotations
 
 import logging
 
-import aiohttp
-from esphome_dashboard_api import ESPHomeDashboardAPI
-
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_PASSWORD, CONF_URL, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import aiohttp_client
 
+from .api import async_create_dashboard_api
 from .const import DOMAIN as DOMAIN
 from .coordinator import ESPHomeDashboardCoordinator
 from .models import ESPHomeDashboardRuntimeData
@@ -31,22 +28,14 @@ async def async_setup_entry(
     username = entry.data.get(CONF_USERNAME)
     password = entry.data.get(CONF_PASSWORD)
 
-    # Create session with authentication if credentials are provided
-    auth = aiohttp.BasicAuth(username, password) if username and password else None
-    session = aiohttp_client.async_create_clientsession(
-        hass, auth=auth, raise_for_status=True
-    )
-    api = ESPHomeDashboardAPI(url, session)
+    # Use the shared session, passing credentials on each request if provided
+    api = async_create_dashboard_api(hass, url, username, password)
 
     coordinator = ESPHomeDashboardCoordinator(hass, api, entry)
 
     await coordinator.async_config_entry_first_refresh()
 
-    # Store both coordinator and session for proper cleanup
-    entry.runtime_data = ESPHomeDashboardRuntimeData(
-        coordinator=coordinator,
-        session=session,
-    )
+    entry.runtime_data = ESPHomeDashboardRuntimeData(coordinator=coordinator)
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -57,10 +46,4 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: ESPHomeDashboardConfigEntry
 ) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-
-    if unload_ok:
-        # Close the aiohttp session to prevent resource leaks
-        await entry.runtime_data.session.close()
-
-    return unload_ok
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
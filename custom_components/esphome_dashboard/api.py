@@ -0,0 +1,49 @@
+"""API client helpers for ESPHome Dashboard integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
+
+import aiohttp
+from esphome_dashboard_api import ESPHomeDashboardAPI
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import aiohttp_client
+
+if TYPE_CHECKING:
+    from aiohttp.client import _RequestContextManager, _WSRequestContextManager
+
+
+class DashboardSession:
+    """Shared aiohttp session that adds dashboard credentials to each request.
+
+    Home Assistant's shared session cannot carry per-dashboard authentication,
+    so the credentials are passed on every request instead. This keeps the
+    pooled connections of the shared session while supporting multiple
+    dashboards with different credentials.
+    """
+
+    def __init__(
+        self, session: aiohttp.ClientSession, auth: aiohttp.BasicAuth | None
+    ) -> None:
+        """Initialize the session wrapper."""
+        self._session = session
+        self._auth = auth
+
+    def request(self, method: str, url: str, **kwargs: Any) -> _RequestContextManager:
+        """Perform an HTTP request against the dashboard."""
+        return self._session.request(method, url, auth=self._auth, **kwargs)
+
+    def ws_connect(self, url: str, **kwargs: Any) -> _WSRequestContextManager:
+        """Open a websocket connection to the dashboard."""
+        return self._session.ws_connect(url, auth=self._auth, **kwargs)
+
+
+@callback
+def async_create_dashboard_api(
+    hass: HomeAssistant, url: str, username: str | None, password: str | None
+) -> ESPHomeDashboardAPI:
+    """Create a dashboard API client using Home Assistant's shared session."""
+    auth = aiohttp.BasicAuth(username, password) if username and password else None
+    session = DashboardSession(aiohttp_client.async_get_clientsession(hass), auth)
+    return ESPHomeDashboardAPI(url, cast(aiohttp.ClientSession, session))
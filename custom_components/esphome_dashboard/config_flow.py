@@ -5,16 +5,15 @@ from __future__ import annotations
 from collections.abc import Mapping
 import logging
 from typing import Any
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 
 import aiohttp
-from esphome_dashboard_api import ESPHomeDashboardAPI
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_PASSWORD, CONF_URL, CONF_USERNAME
-from homeassistant.helpers import aiohttp_client
 
+from .api import async_create_dashboard_api
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +27,20 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 )
 
 
+def _parse_url(url: str) -> ParseResult | None:
+    """Parse and validate the dashboard URL, returning None if it is invalid."""
+    try:
+        parsed = urlparse(url)
+        if not parsed.scheme or not parsed.netloc:
+            return None
+        # Access port to validate it's in valid range (0-65535)
+        # This raises ValueError if port is out of range
+        _ = parsed.port
+    except ValueError:
+        return None
+    return parsed
+
+
 class ESPHomeDashboardConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for ESPHome Dashboard."""
 
@@ -37,39 +50,17 @@ class ESPHomeDashboardConfigFlow(ConfigFlow, domain=DOMAIN):
     async def _validate_input(
         self, url: str, username: str | None, password: str | None
     ) -> dict[str, str]:
-        """Validate the user input and test connection.
+        """Test connection to the dashboard with the given credentials.
 
+        The URL format is expected to be validated with _parse_url beforehand.
         Returns a dict of errors, empty if validation succeeds.
         """
         errors: dict[str, str] = {}
 
-        # Validate URL format
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                errors["base"] = "invalid_url"
-                return errors
-            # Access port to validate it's in valid range (0-65535)
-            # This raises ValueError if port is out of range
-            _ = parsed.port
-        except ValueError:
-            errors["base"] = "invalid_url"
-            return errors
-
-        # Test connection to the dashboard
-        auth = aiohttp.BasicAuth(username, password) if username and password else None
-        session = aiohttp_client.async_create_clientsession(
-            self.hass, auth=auth, raise_for_status=True
-        )
+        # Test connection to the dashboard using the shared session
+        api = async_create_dashboard_api(self.hass, url, username, password)
 
         try:
-            api = ESPHomeDashboardAPI(url, session)
-            # Check if we can reach the dashboard - login page returns HTML, not JSON
-            # Just verify we get a successful response (raise_for_status handles errors)
-            async with session.get(f"{url}/") as resp:
-                if resp.status != 200:
-                    errors["base"] = "cannot_connect"
-                    return errors
             devices_data = await api.get_devices()
             if "configured" not in devices_data:
                 errors["base"] = "invalid_dashboard"
@@ -82,8 +73,6 @@ class ESPHomeDashboardConfigFlow(ConfigFlow, domain=DOMAIN):
         except Exception:
             _LOGGER.exception("Failed to connect to ESPHome Dashboard")
             errors["base"] = "cannot_connect"
-        finally:
-            await session.close()
 
         return errors
 
@@ -99,7 +88,10 @@ class ESPHomeDashboardConfigFlow(ConfigFlow, domain=DOMAIN):
             password = user_input.get(CONF_PASSWORD)
 
             # Validate input
-            errors = await self._validate_input(url, username, password)
+            if (parsed := _parse_url(url)) is None:
+                errors["base"] = "invalid_url"
+            else:
+                errors = await self._validate_input(url, username, password)
 
             if not errors:
                 # Create a unique ID based on the URL
@@ -112,7 +104,7 @@ class ESPHomeDashboardConfigFlow(ConfigFlow, domain=DOMAIN):
                     data[CONF_USERNAME] = username
                     data[CONF_PASSWORD] = password
 
-                parsed = urlparse(url)
+                assert parsed is not None
                 return self.async_create_entry(
                     title=f"ESPHome Dashboard ({parsed.netloc})",
                     data=data,
@@ -140,7 +132,10 @@ class ESPHomeDashboardConfigFlow(ConfigFlow, domain=DOMAIN):
             password = user_input.get(CONF_PASSWORD)
 
             # Validate input
-            errors = await self._validate_input(url, username, password)
+            if _parse_url(url) is None:
+                errors["base"] = "invalid_url"
+            else:
+                errors = await self._validate_input(url, username, password)
 
             if not errors:
                 # Check if the new URL is already configured by another entry
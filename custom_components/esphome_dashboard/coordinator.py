@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 from datetime import timedelta
+from http import HTTPStatus
 import logging
+import sys
+from typing import TYPE_CHECKING
 
 import aiohttp
-from esphome_dashboard_api import ConfiguredDevice, ESPHomeDashboardAPI
+from aiohttp import hdrs
+from esphome_dashboard_api import ConfiguredDevice, Devices, ESPHomeDashboardAPI
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+if TYPE_CHECKING:
+    from homeassistant.components.esphome import RuntimeEntryData
+
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(minutes=5)
@@ -36,17 +43,71 @@ class ESPHomeDashboardCoordinator(DataUpdateCoordinator[dict[str, ConfiguredDevi
             config_entry=config_entry,
         )
         self.api = api
+        # Entity tag of the last devices response, for conditional requests
+        self._etag: str | None = None
+        # ESPHome integration entry data by device name, built lazily and
+        # reset on every update since ESPHome entries may load or unload
+        self._esphome_entries: dict[str, RuntimeEntryData] | None = None
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Reset the ESPHome entry index and update all listeners."""
+        self._esphome_entries = None
+        super().async_update_listeners()
+
+    @callback
+    def async_get_esphome_entry_data(self, device_name: str) -> RuntimeEntryData | None:
+        """Find RuntimeEntryData for an ESPHome device by name.
+
+        Returns the RuntimeEntryData from a loaded ESPHome config entry if the
+        device name matches. This allows us to get the actual device version
+        instead of relying on the dashboard's potentially stale deployed_version.
+        """
+        if self._esphome_entries is None:
+            self._esphome_entries = {}
+            for entry in self.hass.config_entries.async_entries("esphome"):
+                if entry.state != ConfigEntryState.LOADED:
+                    continue
+                entry_data: RuntimeEntryData = entry.runtime_data
+                if entry_data.device_info:
+                    self._esphome_entries.setdefault(
+                        entry_data.device_info.name, entry_data
+                    )
+        return self._esphome_entries.get(device_name)
+
+    async def _async_get_devices(self) -> Devices | None:
+        """Fetch devices from the dashboard.
+
+        Returns None if the devices are unchanged since the last fetch.
+        """
+        headers: dict[str, str] = {}
+        if self._etag is not None and self.data is not None:
+            headers[hdrs.IF_NONE_MATCH] = self._etag
+
+        async with self.api.session.request(
+            "GET", f"{self.api.url}/devices", headers=headers
+        ) as resp:
+            if resp.status == HTTPStatus.NOT_MODIFIED:
+                return None
+            resp.raise_for_status()
+            devices_data: Devices = await resp.json()
+            self._etag = resp.headers.get(hdrs.ETAG)
+        return devices_data
 
     async def _async_update_data(self) -> dict[str, ConfiguredDevice]:
         """Fetch device data from the dashboard."""
         try:
-            devices_data = await self.api.get_devices()
+            devices_data = await self._async_get_devices()
+            if devices_data is None:
+                # Nothing changed on the dashboard since the last refresh
+                return self.data
             configured_devices: list[ConfiguredDevice] = devices_data.get(
                 "configured", []
             )
 
-            # Return devices indexed by their name
-            return {device["name"]: device for device in configured_devices}
+            # Return devices indexed by their name; interning keeps the keys
+            # identical across refreshes so lookups compare by identity
+            return {sys.intern(device["name"]): device for device in configured_devices}
         except aiohttp.ClientResponseError as err:
             if err.status in (401, 403):
                 raise ConfigEntryAuthFailed(
@@ -4,14 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
-from aiohttp import ClientSession
-
 from .coordinator import ESPHomeDashboardCoordinator
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ESPHomeDashboardRuntimeData:
     """Runtime data for ESPHome Dashboard integration."""
 
     coordinator: ESPHomeDashboardCoordinator
-    session: ClientSession
@@ -2,20 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections import defaultdict
 import logging
+import sys
 from typing import TYPE_CHECKING, Any
 
-from aioesphomeapi import APIClient, APIConnectionError
+from aioesphomeapi import APIClient, APIConnectionError, ResolveAPIError, SocketAPIError
+from aioesphomeapi.core import TimeoutAPIError
 from esphome_dashboard_api import ConfiguredDevice
 from zeroconf.asyncio import AsyncServiceInfo
 
 from homeassistant.components import zeroconf
 from homeassistant.components.update import UpdateEntity, UpdateEntityFeature
-from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import CONF_URL
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.device_registry import CONNECTION_NETWORK_MAC, DeviceInfo
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -32,43 +36,58 @@ DEFAULT_PORT = 6053
 
 _LOGGER = logging.getLogger(__name__)
 
+# Manufacturer of standalone devices created by this integration
+MANUFACTURER = "ESPHome"
+
 # ESPHome mDNS service type for port discovery
 ESPHOME_SERVICE_TYPE = "_esphomelib._tcp.local."
 
-# All entities share a DataUpdateCoordinator, so no parallel updates needed
-PARALLEL_UPDATES = 0
+# Timeout in milliseconds for mDNS queries when the port is not cached
+MDNS_QUERY_TIMEOUT_MS = 1000
 
+# Supported features indexed by whether the device has an address for OTA
+_FEATURES = (UpdateEntityFeature(0), UpdateEntityFeature.INSTALL)
+
+# Cooldown in seconds for coalescing device discovery on coordinator updates
+DISCOVERY_COOLDOWN = 1.0
+
+# Time in seconds to let a device reboot after OTA before querying its version
+POST_INSTALL_QUERY_DELAY = 10
+
+# Native API ports discovered via mDNS by device name. mDNS names are unique
+# on the network, so lookups are shared by all dashboards.
+_port_cache: dict[str, int] = {}
+_port_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+# All entities share a DataUpdateCoordinator; installs target different devices
+# and may run concurrently, so actions are not limited either (0 = unlimited)
+PARALLEL_UPDATES = 0
 
-def _find_esphome_device_mac(hass: HomeAssistant, device_name: str) -> str | None:
-    """Find MAC address for an ESPHome device by name in device registry."""
-    dev_reg = dr.async_get(hass)
 
-    # Search for device by name (case-insensitive comparison)
+def _build_device_mac_index(dev_reg: dr.DeviceRegistry) -> dict[str, str]:
+    """Index MAC addresses of registered devices by lowercased device name."""
+    name_to_mac: dict[str, str] = {}
     for device in dev_reg.devices.values():
-        if device.name and device.name.lower() == device_name.lower():
-            # Check if this device has a MAC connection (from ESPHome integration)
-            for conn_type, conn_id in device.connections:
-                if conn_type == CONNECTION_NETWORK_MAC:
-                    return conn_id
-    return None
-
-
-def _find_esphome_entry_data(
-    hass: HomeAssistant, device_name: str
-) -> RuntimeEntryData | None:
-    """Find RuntimeEntryData for an ESPHome device by name.
-
-    Returns the RuntimeEntryData from a loaded ESPHome config entry if the
-    device name matches. This allows us to get the actual device version
-    instead of relying on the dashboard's potentially stale deployed_version.
-    """
-    for entry in hass.config_entries.async_entries("esphome"):
-        if entry.state != ConfigEntryState.LOADED:
+        if not device.name:
             continue
-        entry_data: RuntimeEntryData = entry.runtime_data
-        if entry_data.device_info and entry_data.device_info.name == device_name:
-            return entry_data
-    return None
+        # Check if this device has a MAC connection (from ESPHome integration)
+        for conn_type, conn_id in device.connections:
+            if conn_type == CONNECTION_NETWORK_MAC:
+                name_to_mac.setdefault(sys.intern(device.name.lower()), conn_id)
+                break
+    return name_to_mac
+
+
+def _standalone_device_info(
+    identifier: str, device_name: str, configuration_url: str
+) -> DeviceInfo:
+    """Return device info for a device not known to the ESPHome integration."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, identifier)},
+        name=device_name,
+        manufacturer=MANUFACTURER,
+        configuration_url=configuration_url,
+    )
 
 
 async def async_setup_entry(
@@ -78,34 +97,81 @@ async def async_setup_entry(
 ) -> None:
     """Set up ESPHome Dashboard update entities."""
     coordinator: ESPHomeDashboardCoordinator = entry.runtime_data.coordinator
+    dev_reg = dr.async_get(hass)
+
+    # Shared by all standalone devices of this dashboard
+    # (the URL is stored without a trailing slash by the config flow)
+    configuration_url = f"{entry.data[CONF_URL]}/"
+    unique_id_prefix = sys.intern(f"{entry.entry_id}_")
 
     # Track which devices we've already created entities for
     known_devices: set[str] = set()
 
+    # Name to MAC index of the device registry, rebuilt lazily after changes
+    name_to_mac: dict[str, str] | None = None
+
+    @callback
+    def async_invalidate_mac_index(
+        event: Event[dr.EventDeviceRegistryUpdatedData],
+    ) -> None:
+        """Drop the name to MAC index when the device registry changes."""
+        nonlocal name_to_mac
+        name_to_mac = None
+
     @callback
     def async_add_update_entities() -> None:
         """Add update entities for devices."""
-        entities: list[ESPHomeDashboardUpdateEntity] = []
+        nonlocal name_to_mac
+        new_devices = coordinator.data.keys() - known_devices
+        if not new_devices:
+            return
 
+        if name_to_mac is None:
+            name_to_mac = _build_device_mac_index(dev_reg)
+
+        entities: list[ESPHomeDashboardUpdateEntity] = []
+        # Add in dashboard order so entity IDs are assigned deterministically
         for device_name, device_data in coordinator.data.items():
-            if device_name not in known_devices:
-                known_devices.add(device_name)
-                # Try to find MAC address for existing ESPHome device
-                mac_address = _find_esphome_device_mac(hass, device_name)
-                entities.append(
-                    ESPHomeDashboardUpdateEntity(
-                        coordinator, device_name, device_data, mac_address
-                    )
+            if device_name not in new_devices:
+                continue
+            # Try to find MAC address for existing ESPHome device
+            # (case-insensitive name match)
+            mac_address = name_to_mac.get(device_name.lower())
+            entities.append(
+                ESPHomeDashboardUpdateEntity(
+                    coordinator,
+                    unique_id_prefix,
+                    configuration_url,
+                    device_name,
+                    device_data,
+                    mac_address,
                 )
+            )
 
-        if entities:
-            async_add_entities(entities)
+        known_devices.update(new_devices)
+        async_add_entities(entities)
 
-    # Add entities on initial setup
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, async_invalidate_mac_index
+        )
+    )
+
+    # Add entities on initial setup; the first refresh already ran before the
+    # platform was set up, so this adds all initially known devices at once
     async_add_update_entities()
 
-    # Add entities when new devices are discovered and register cleanup
-    entry.async_on_unload(coordinator.async_add_listener(async_add_update_entities))
+    # Add entities when new devices are discovered, coalescing bursts of
+    # coordinator updates, and register cleanup
+    debouncer = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=DISCOVERY_COOLDOWN,
+        immediate=True,
+        function=async_add_update_entities,
+    )
+    entry.async_on_unload(debouncer.async_shutdown)
+    entry.async_on_unload(coordinator.async_add_listener(debouncer.async_schedule_call))
 
 
 class ESPHomeDashboardUpdateEntity(
@@ -121,12 +187,16 @@ class ESPHomeDashboardUpdateEntity(
         """Return the entity picture to use in the frontend.
 
         Use ESPHome brand icon since this integration is part of the ESPHome brand.
+        UpdateEntity derives its picture from the platform and ignores
+        _attr_entity_picture, so the property has to be overridden.
         """
         return "https://brands.home-assistant.io/_/esphome/icon.png"
 
     def __init__(
         self,
         coordinator: ESPHomeDashboardCoordinator,
+        unique_id_prefix: str,
+        configuration_url: str,
         device_name: str,
         device_data: ConfiguredDevice,
         mac_address: str | None,
@@ -134,12 +204,8 @@ class ESPHomeDashboardUpdateEntity(
         """Initialize the update entity."""
         super().__init__(coordinator)
 
-        # config_entry is always set for this coordinator
-        assert coordinator.config_entry is not None
-        entry_id = coordinator.config_entry.entry_id
-
         self._device_name = device_name
-        self._attr_unique_id = f"{entry_id}_{device_name}"
+        self._attr_unique_id = unique_id_prefix + device_name
 
         # Store configuration filename and address for OTA updates
         self._configuration = device_data.get("configuration", f"{device_name}.yaml")
@@ -150,10 +216,16 @@ class ESPHomeDashboardUpdateEntity(
         self._cached_device_version: str | None = None
         self._esphome_unsubscribe: CALLBACK_TYPE | None = None
         self._dashboard_deployed_version: str | None = None
+        # Version assumed after a successful install, until confirmed by the
+        # device or superseded by the dashboard
+        self._installed_version_after_ota: str | None = None
+
+        # Background direct version query, to avoid overlapping queries
+        self._fetch_task: asyncio.Task[None] | None = None
 
-        # Build configuration URL from dashboard URL
-        dashboard_url = coordinator.config_entry.data[CONF_URL]
-        configuration_url = f"{dashboard_url.rstrip('/')}/"
+        # Last device data and written state, to skip writes when nothing changed
+        self._last_snapshot: tuple[str | None, str | None, str | None] | None = None
+        self._last_written_state: tuple[Any, ...] | None = None
 
         # Link to existing ESPHome device using MAC address connection
         # This ensures the update entity appears on the same device as the ESPHome integration
@@ -164,11 +236,8 @@ class ESPHomeDashboardUpdateEntity(
             )
         else:
             # Fallback: create standalone device if no MAC address available
-            self._attr_device_info = DeviceInfo(
-                identifiers={(DOMAIN, f"{entry_id}_{device_name}")},
-                name=device_name,
-                manufacturer="ESPHome",
-                configuration_url=configuration_url,
+            self._attr_device_info = _standalone_device_info(
+                self._attr_unique_id, device_name, configuration_url
             )
 
         self._update_attrs(device_data)
@@ -178,8 +247,8 @@ class ESPHomeDashboardUpdateEntity(
         await super().async_added_to_hass()
 
         # Try to find esphome integration entry for this device
-        self._esphome_entry_data = _find_esphome_entry_data(
-            self.hass, self._device_name
+        self._esphome_entry_data = self.coordinator.async_get_esphome_entry_data(
+            self._device_name
         )
 
         if self._esphome_entry_data:
@@ -193,30 +262,56 @@ class ESPHomeDashboardUpdateEntity(
                 )
             )
             # Update state immediately with esphome version
-            self.async_write_ha_state()
-        elif self._address:
-            # Not in esphome integration - query device directly
-            self.hass.async_create_task(self._async_fetch_device_version())
+            self._update_installed_version()
+            self._async_write_ha_state_if_changed()
+        elif self._address and not (
+            self._dashboard_deployed_version
+            and self._dashboard_deployed_version == self._attr_latest_version
+        ):
+            # Not in esphome integration and the dashboard reports an outdated
+            # or unknown version - query device directly
+            self._async_schedule_version_fetch()
 
     async def _async_discover_device_port(self) -> int | None:
         """Discover device port via mDNS.
 
         Returns the native API port advertised by the device, or None if not found.
         """
-        try:
-            aiozc = await zeroconf.async_get_async_instance(self.hass)
-            service_name = f"{self._device_name}.{ESPHOME_SERVICE_TYPE}"
-
-            info = AsyncServiceInfo(ESPHOME_SERVICE_TYPE, service_name)
-            if await info.async_request(aiozc.zeroconf, timeout=3.0):
+        if (port := _port_cache.get(self._device_name)) is not None:
+            return port
+
+        # Only one lookup per device name at a time; others reuse its result
+        async with _port_locks[self._device_name]:
+            if (port := _port_cache.get(self._device_name)) is not None:
+                return port
+
+            try:
+                aiozc = await zeroconf.async_get_async_instance(self.hass)
+                service_name = f"{self._device_name}.{ESPHOME_SERVICE_TYPE}"
+
+                # Try the zeroconf cache first, only query the network on a miss
+                info = AsyncServiceInfo(ESPHOME_SERVICE_TYPE, service_name)
+                if not info.load_from_cache(aiozc.zeroconf) and not (
+                    await info.async_request(
+                        aiozc.zeroconf, timeout=MDNS_QUERY_TIMEOUT_MS
+                    )
+                ):
+                    return None
+            except (TimeoutError, OSError, AttributeError):
+                # AttributeError can occur if zeroconf is not properly initialized
                 _LOGGER.debug(
-                    "Discovered port %s for %s via mDNS", info.port, self._device_name
+                    "Failed to discover port for %s via mDNS", self._device_name
                 )
-                return info.port
-        except (TimeoutError, OSError, AttributeError):
-            # AttributeError can occur if zeroconf is not properly initialized
-            _LOGGER.debug("Failed to discover port for %s via mDNS", self._device_name)
-        return None
+                return None
+
+            if info.port is None:
+                return None
+
+            _LOGGER.debug(
+                "Discovered port %s for %s via mDNS", info.port, self._device_name
+            )
+            _port_cache[self._device_name] = info.port
+            return info.port
 
     async def _async_query_device_version(self, address: str) -> str | None:
         """Query device version directly via native API.
@@ -236,44 +331,93 @@ class ESPHomeDashboardUpdateEntity(
         try:
             await client.connect(login=False)
             device_info = await client.device_info()
-        except APIConnectionError:
+        except APIConnectionError as err:
             _LOGGER.debug(
                 "Direct query failed for %s, using dashboard version", self._device_name
             )
+            # The port may have changed if the device could not be reached,
+            # discover it again next time. Handshake and auth errors (e.g.
+            # encrypted devices) reached the device, so keep its port.
+            if isinstance(err, (SocketAPIError, ResolveAPIError, TimeoutAPIError)):
+                _port_cache.pop(self._device_name, None)
             return None
         else:
             return device_info.esphome_version
         finally:
             await client.disconnect()
 
-    async def _async_fetch_device_version(self) -> None:
+    @callback
+    def _async_schedule_version_fetch(self, delay: float = 0) -> None:
+        """Fetch device version in the background unless already in progress.
+
+        The task is created through the config entry so Home Assistant startup
+        does not wait on it and unloading the entry cancels it.
+        """
+        if self._fetch_task is not None and not self._fetch_task.done():
+            return
+
+        assert self.coordinator.config_entry is not None
+        self._fetch_task = self.coordinator.config_entry.async_create_background_task(
+            self.hass,
+            self._async_fetch_device_version(delay),
+            name=f"esphome_dashboard_fetch_{self._device_name}",
+        )
+        self._fetch_task.add_done_callback(self._async_version_fetch_done)
+
+    @callback
+    def _async_version_fetch_done(self, task: asyncio.Task[None]) -> None:
+        """Forget the version fetch task once it is done."""
+        if self._fetch_task is task:
+            self._fetch_task = None
+
+    async def _async_fetch_device_version(self, delay: float = 0) -> None:
         """Fetch device version via direct API query and update state."""
+        if delay:
+            await asyncio.sleep(delay)
+
         if not self._address:
             return
 
         version = await self._async_query_device_version(self._address)
         if version:
             self._cached_device_version = version
-            self.async_write_ha_state()
+            self._update_installed_version()
+            self._async_write_ha_state_if_changed()
 
     async def async_will_remove_from_hass(self) -> None:
         """Handle entity being removed from Home Assistant."""
         if self._esphome_unsubscribe:
             self._esphome_unsubscribe()
             self._esphome_unsubscribe = None
+        if self._fetch_task is not None:
+            self._fetch_task.cancel()
+            self._fetch_task = None
 
     @callback
     def _handle_esphome_device_update(self) -> None:
         """Handle device update from esphome integration."""
-        self.async_write_ha_state()
+        # Device updates fire for many reasons, only the version matters here
+        entry_data = self._esphome_entry_data
+        if (
+            entry_data
+            and entry_data.device_info
+            and entry_data.device_info.esphome_version == self._attr_installed_version
+        ):
+            return
+        self._update_installed_version()
+        self._async_write_ha_state_if_changed()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        changed = False
+
         # Re-check for esphome integration if not already linked
         # (handles case where esphome loads after esphome_dashboard)
         if not self._esphome_entry_data:
-            entry_data = _find_esphome_entry_data(self.hass, self._device_name)
+            entry_data = self.coordinator.async_get_esphome_entry_data(
+                self._device_name
+            )
             if entry_data:
                 _LOGGER.debug(
                     "Found esphome integration for %s on coordinator update",
@@ -285,24 +429,66 @@ class ESPHomeDashboardUpdateEntity(
                 )
                 # Clear cached version since esphome has authoritative data
                 self._cached_device_version = None
+                self._update_installed_version()
+                changed = True
 
-        if self._device_name in self.coordinator.data:
-            device_data = self.coordinator.data[self._device_name]
-            self._update_attrs(device_data)
-        else:
+        device_data = self.coordinator.data.get(self._device_name)
+        if device_data is not None:
+            changed |= self._update_attrs(device_data)
+        elif self._attr_available:
             # Device was removed from dashboard
             self._attr_available = False
+            changed = True
+
+        # Nothing to write unless the data or the coordinator's availability
+        # changed since the last write
+        if (
+            not changed
+            and self._last_written_state is not None
+            and self._last_written_state[0] == self.available
+        ):
+            return
 
+        self._async_write_ha_state_if_changed()
+
+    @callback
+    def _async_write_ha_state_if_changed(self) -> None:
+        """Write the state only if any attribute shown in it has changed."""
+        state = (
+            self.available,
+            self.installed_version,
+            self._attr_latest_version,
+            self._attr_supported_features,
+        )
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
         self.async_write_ha_state()
 
-    def _update_attrs(self, device_data: ConfiguredDevice) -> None:
-        """Update entity attributes from device data."""
+    def _update_attrs(self, device_data: ConfiguredDevice) -> bool:
+        """Update entity attributes from device data.
+
+        Returns True if the device data differs from the last update.
+        """
+        snapshot = (
+            device_data.get("deployed_version"),
+            device_data.get("current_version"),
+            device_data.get("address"),
+        )
+        if self._attr_available and snapshot == self._last_snapshot:
+            return False
+        self._last_snapshot = snapshot
+
         self._attr_available = True
 
         # Get version information from ESPHome Dashboard API:
         # - deployed_version: firmware version currently running on the device (can be stale)
         # - current_version: version available in the YAML configuration
-        self._dashboard_deployed_version = device_data.get("deployed_version")
+        deployed_version = device_data.get("deployed_version")
+        if deployed_version != self._dashboard_deployed_version:
+            # The dashboard reports a newer view of the deployed firmware
+            self._installed_version_after_ota = None
+        self._dashboard_deployed_version = deployed_version
         available_version = device_data.get("current_version")
 
         self._attr_latest_version = (
@@ -313,33 +499,39 @@ class ESPHomeDashboardUpdateEntity(
         self._address = device_data.get("address")
 
         # Enable install feature if device has an address for OTA
-        if self._address:
-            self._attr_supported_features = UpdateEntityFeature.INSTALL
-        else:
-            self._attr_supported_features = UpdateEntityFeature(0)
+        self._attr_supported_features = _FEATURES[bool(self._address)]
 
-    @property
-    def installed_version(self) -> str | None:
-        """Return installed version with priority: esphome > cached > dashboard.
+        self._update_installed_version()
+        return True
+
+    def _update_installed_version(self) -> None:
+        """Update installed version.
+
+        Priority: esphome > cached > assumed after OTA > dashboard.
 
         The ESPHome dashboard's deployed_version can be stale or incorrect.
         Prefer the actual version from the device when available.
         """
         # Priority 1: ESPHome integration (authoritative, live updates)
         if self._esphome_entry_data and self._esphome_entry_data.device_info:
-            return self._esphome_entry_data.device_info.esphome_version
-
+            self._attr_installed_version = (
+                self._esphome_entry_data.device_info.esphome_version
+            )
         # Priority 2: Cached version from direct API query
-        if self._cached_device_version:
-            return self._cached_device_version
-
-        # Priority 3: Fallback to dashboard's deployed_version
-        return self._dashboard_deployed_version
+        elif self._cached_device_version:
+            self._attr_installed_version = self._cached_device_version
+        # Priority 3: Version assumed after a successful install
+        elif self._installed_version_after_ota:
+            self._attr_installed_version = self._installed_version_after_ota
+        # Priority 4: Fallback to dashboard's deployed_version
+        else:
+            self._attr_installed_version = self._dashboard_deployed_version
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return super().available and self._device_name in self.coordinator.data
+        # _attr_available tracks whether the device is still on the dashboard
+        return super().available and self._attr_available
 
     async def async_install(
         self, version: str | None, backup: bool, **kwargs: Any
@@ -385,13 +577,22 @@ class ESPHomeDashboardUpdateEntity(
             self._device_name,
         )
 
-        # Clear cached version to force re-query after OTA
+        # Clear cached version to force re-query after OTA, and assume the
+        # device now runs the latest version until it is confirmed
         self._cached_device_version = None
+        self._installed_version_after_ota = self._attr_latest_version
+        self._update_installed_version()
+        self._async_write_ha_state_if_changed()
 
         # Refresh coordinator data to get updated version info from dashboard
-        await self.coordinator.async_request_refresh()
+        # without holding up the install action
+        self.hass.async_create_task(self.coordinator.async_request_refresh())
 
-        # If not using esphome integration, re-query device version
-        # (device needs time to reboot after OTA, but we can try immediately)
+        # If not using esphome integration, re-query device version in the
+        # background once the device had time to reboot after OTA, replacing
+        # any query started before the install
         if not self._esphome_entry_data and self._address:
-            await self._async_fetch_device_version()
+            if self._fetch_task is not None:
+                self._fetch_task.cancel()
+                self._fetch_task = None
+            self._async_schedule_version_fetch(POST_INSTALL_QUERY_DELAY)